@@ -430,9 +430,9 @@ class NoSQLInjectionScanner:
                     ).geturl()
                     
                     # Send request
-                    start_time = time.time()
+                    start_time = time.perf_counter()
                     response = requests.get(test_url, timeout=timeout, verify=False)
-                    elapsed = time.time() - start_time
+                    elapsed = time.perf_counter() - start_time
                     
                     # Check for time-based injection
                     if 'sleep' in payload_type and elapsed >= 5:
@@ -45,12 +45,17 @@ def scanner(url: str) -> tuple[bool, str]:
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
             }
+            r = None
             try:
                 if url.endswith("/"):
                     url = url[:-1]
                 else:
                     url = url
-                r = s.get(f"{url}{endpoint}", timeout=int(args.timeout), headers=headers, verify=False)
+                # Only the heap dump is streamed: it can be hundreds of MB and is judged
+                # by Content-Type alone. Other bodies are small and read eagerly so their
+                # connection returns to the pool and read errors reach the handlers below.
+                stream = endpoint == "/actuator/heapdump"
+                r = s.get(f"{url}{endpoint}", timeout=int(args.timeout), headers=headers, verify=False, stream=stream)
                 print(f"{Fore.YELLOW}[*] Status: {r.status_code}{Fore.RESET}")  # Debug output
                 
                 if r.status_code == 200:
@@ -108,6 +113,9 @@ def scanner(url: str) -> tuple[bool, str]:
             except requests.exceptions.RequestException as e:
                 print(f"{Fore.RED}[-] Error on {endpoint}: {str(e)}{Fore.RESET}")
                 continue
+            finally:
+                if r is not None:
+                    r.close()
                 
     except Exception as e:
         print(f"{Fore.RED}[-] Scanner error: {str(e)}{Fore.RESET}")
@@ -8,11 +8,15 @@ import shlex
 import subprocess
 import logging
 import ipaddress
-from typing import Optional, List, Dict, Union
+import threading
+import html
+from collections import deque
+from typing import Optional, List, Dict, Union, Deque
 from pathlib import Path
 from functools import wraps
-from time import time, sleep
+from time import monotonic, sleep
 import requests
+import urllib3
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -222,28 +226,16 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.period = period
-        self.calls: List[float] = []
+        # Timestamps are appended in order, so expired ones are always at the left.
+        # Only the newest max_calls entries can ever matter, so cap the buffer.
+        self.calls: Deque[float] = deque(maxlen=max_calls)
+        self._lock = threading.Lock()
     
     def __call__(self, func):
         """Decorator to rate limit function calls"""
         @wraps(func)
         def wrapper(*args, **kwargs):
-            now = time()
-            
-            # Remove calls outside the time window
-            self.calls = [c for c in self.calls if now - c < self.period]
-            
-            # If limit reached, wait
-            if len(self.calls) >= self.max_calls:
-                sleep_time = self.period - (now - self.calls[0])
-                logger.info(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
-                sleep(sleep_time)
-                # Re-check after sleeping
-                now = time()
-                self.calls = [c for c in self.calls if now - c < self.period]
-            
-            # Record this call
-            self.calls.append(time())
+            self.wait_if_needed()
             
             # Execute function
             return func(*args, **kwargs)
@@ -252,15 +244,34 @@ class RateLimiter:
     
     def wait_if_needed(self):
         """Manually wait if rate limit is reached"""
-        now = time()
-        self.calls = [c for c in self.calls if now - c < self.period]
+        # Reserve a slot under the lock, then sleep without holding it so
+        # other threads are not serialized behind this one's wait
+        with self._lock:
+            # Read the clock once per call; monotonic time is immune to NTP jumps
+            now = monotonic()
+            
+            # Remove calls outside the time window
+            self._expire(now)
+            
+            # If limit reached, this call may start once the oldest one expires
+            if len(self.calls) >= self.max_calls:
+                start = self.calls[0] + self.period
+            else:
+                start = now
+            
+            # Record this call
+            self.calls.append(start)
         
-        if len(self.calls) >= self.max_calls:
-            sleep_time = self.period - (now - self.calls[0])
+        sleep_time = start - now
+        if sleep_time > 0:
             logger.info(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
             sleep(sleep_time)
-        
-        self.calls.append(time())
+    
+    def _expire(self, now: float):
+        """Drop expired timestamps; only touches the entries that actually expired"""
+        calls = self.calls
+        while calls and now - calls[0] >= self.period:
+            calls.popleft()
 
 
 class SecureHTTPSession:
@@ -271,7 +282,8 @@ class SecureHTTPSession:
                  pool_connections: int = 10,
                  pool_maxsize: int = 20,
                  verify_ssl: bool = True,
-                 timeout: int = 10):
+                 timeout: int = 10,
+                 backoff_jitter: float = 0.5):
         """
         Initialize secure HTTP session
         
@@ -281,18 +293,25 @@ class SecureHTTPSession:
             pool_maxsize: Maximum size of connection pool
             verify_ssl: Whether to verify SSL certificates
             timeout: Default timeout for requests
+            backoff_jitter: Max random seconds added to each retry backoff
         """
         self.session = requests.Session()
         self.verify_ssl = verify_ssl
         self.timeout = timeout
         
         # Configure retry strategy
-        retry_strategy = Retry(
+        retry_options = dict(
             total=max_retries,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
         )
+        try:
+            # Jitter keeps many workers from retrying a failing host in lockstep
+            retry_strategy = Retry(backoff_jitter=backoff_jitter, **retry_options)
+        except TypeError:
+            # urllib3 < 2.0 has no backoff_jitter
+            retry_strategy = Retry(**retry_options)
         
         # Configure adapter with connection pooling
         adapter = HTTPAdapter(
@@ -306,7 +325,6 @@ class SecureHTTPSession:
         
         if not verify_ssl:
             logger.warning("SSL verification is disabled - this is insecure!")
-            import urllib3
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     
     def get(self, url: str, **kwargs) -> requests.Response:
@@ -340,7 +358,6 @@ class OutputSanitizer:
     @staticmethod
     def sanitize_html(text: str) -> str:
         """Sanitize text for HTML output"""
-        import html
         return html.escape(text)
     
     @staticmethod
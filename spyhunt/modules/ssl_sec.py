@@ -1,14 +1,20 @@
 import ssl
 import socket
 from datetime import datetime
+from functools import lru_cache
 from colorama import Fore
 
 TLS_VERSION = []
 TLS_VULN_VERSION = ["TLSv1.0", "TLSv1.1", "SSLv2", "SSLv3"]
 
+@lru_cache(maxsize=None)
+def _get_ssl_context():
+    # Loading the system CA store is expensive; build one context and share it
+    return ssl.create_default_context()
+
 def check_ssl(domain: str, port: int = 443):
     try:
-        context = ssl.create_default_context()
+        context = _get_ssl_context()
         with socket.create_connection((domain, port), timeout=5) as sock:
             with context.wrap_socket(sock, server_hostname=domain) as ssock:
                 cert = ssock.getpeercert()
@@ -143,6 +143,16 @@ def scan(command: str) -> str:
             logger.error(f"Unexpected error in scan: {e}")
         return ""
 
+def sample_rate(value):
+    """argparse type for a sampling fraction in (0, 1]"""
+    try:
+        rate = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sample rate: {value}")
+    if not 0 < rate <= 1:
+        raise argparse.ArgumentTypeError(f"sample rate must be in (0, 1]: {value}")
+    return rate
+
 parser = argparse.ArgumentParser()
 group = parser.add_mutually_exclusive_group()
 
@@ -293,8 +303,8 @@ portscanning_group.add_argument('-cidr', '--cidr_notation',
                     metavar='IP/24')
 
 portscanning_group.add_argument('-ps', '--ports',
-                    type=str, help='Port numbers to scan',
-                    metavar='80,443,8443')
+                    type=str, help='Port numbers or ranges to scan',
+                    metavar='80,443,8000-8100')
 
 portscanning_group.add_argument('-pai', '--print_all_ips',
                     type=str, help='Print all ips',
@@ -384,6 +394,8 @@ nuclei_group.add_argument("-nct", "--nuclei_template", type=str, help="use a nuc
 
 
 parser.add_argument("-v", "--verbose", action="store_true", help="Increase output verbosity")
+parser.add_argument('--log-sample-rate', type=sample_rate, default=1.0, metavar='1.0',
+                    help='Fraction of DEBUG log records to keep (e.g. 0.01 keeps 1%%)')
 
 parser.add_argument("-c", "--concurrency", type=int, default=10, help="Maximum number of concurrent requests")
 
@@ -497,8 +509,20 @@ parser.add_argument('--insecure', action='store_true',
 
 args = parser.parse_args()
 
+class DebugSamplingFilter(logging.Filter):
+    """Keep only a random fraction of DEBUG records; other levels always pass"""
+
+    def __init__(self, rate=1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if record.levelno != logging.DEBUG or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
 # Setup logging system
-def setup_logging(log_level="INFO"):
+def setup_logging(log_level="INFO", debug_sample_rate=1.0):
     """Configure structured logging"""
     log_file = "spyhunt.log"
     
@@ -524,6 +548,12 @@ def setup_logging(log_level="INFO"):
     )
     file_handler.setFormatter(file_format)
     
+    # Drop most DEBUG records on high-volume scans before they are formatted.
+    # Handler filters also see records propagated from child loggers
+    # (spyhunt.modules.*), which logger-level filters would not.
+    if debug_sample_rate < 1.0:
+        file_handler.addFilter(DebugSamplingFilter(debug_sample_rate))
+    
     logger.addHandler(console_handler)
     logger.addHandler(file_handler)
     
@@ -531,7 +561,7 @@ def setup_logging(log_level="INFO"):
 
 # Initialize logger
 log_level = "DEBUG" if args.verbose else "INFO"
-logger = setup_logging(log_level)
+logger = setup_logging(log_level, args.log_sample_rate)
 logger.info("SpyHunt v4.0 started")
 
 if args.insecure:
@@ -1220,7 +1250,8 @@ if args.j:
         try:
             async with session.get(url, timeout=10) as response:
                 if response.status == 200:
-                    return await response.text()
+                    # Let aiohttp resolve the charset; don't drop pages over a few bad bytes
+                    return await response.text(errors='replace')
                 elif response.status == 404:
                     # Silently ignore 404 errors
                     return None
@@ -1770,13 +1801,16 @@ if args.forbiddenpass or args.forbidden_domains:
     
     def do_request(url: str, stream=False):
         headers = header_bypass()
+        # One session per URL so every bypass header reuses the same keep-alive connection
+        s = requests.Session()
         try:
             for header in headers:
+                # Each probe must start clean: a cookie set by an earlier probe could
+                # turn a later one into a 200 credited to the wrong header
+                s.cookies.clear()
                 if stream:
-                    s = requests.Session()
                     r = s.get(url, stream=True, headers=header, verify=False, timeout=10)
                 else:
-                    s = requests.Session()
                     r = s.get(url, headers=header, verify=False, timeout=10)
                 if r.status_code == 200:
                     print(Fore.WHITE + url + ' ' + json.dumps(list(header.items())[-1]) + Fore.GREEN + " [{}]".format(r.status_code))
@@ -1785,12 +1819,16 @@ if args.forbiddenpass or args.forbidden_domains:
                     print(Fore.WHITE + url + ' ' + json.dumps(list(header.items())[-1]) + Fore.RED + " [{}]".format(r.status_code))
                 else:
                     print(Fore.WHITE + url + ' ' + json.dumps(list(header.items())[-1]) + Fore.RED + " [{}]".format(r.status_code))
+                # Drop streamed bodies unread instead of leaving the connection checked out
+                r.close()
         except requests.exceptions.ConnectionError:
             pass
         except requests.exceptions.Timeout:
             pass
         except requests.exceptions.RequestException:
             pass
+        finally:
+            s.close()
 
     def load_domains(filename: str) -> list:
         try:
@@ -1963,13 +2001,33 @@ if args.cidr_notation:
                         if open_ports:
                             print(f"IP: {Fore.GREEN}{ip}:{Fore.CYAN}{','.join(map(str, open_ports))}{Fore.RESET}")
 
+            port_spec_re = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
             def parse_ports(ports):
                 if isinstance(ports, list):
-                    return [int(p) for p in ports]
-                return [int(p.strip()) for p in ports.split(',')]
+                    ports = ','.join(map(str, ports))
+                # dict keeps first-seen order while dropping ports from overlapping ranges
+                parsed = {}
+                for token in ports.split(','):
+                    token = token.strip()
+                    match = port_spec_re.fullmatch(token)
+                    if not match:
+                        raise ValueError(f"Invalid port specification: {token!r}")
+                    start = int(match.group(1))
+                    end = int(match.group(2) or start)
+                    if start > end:
+                        raise ValueError(f"Invalid port range (start > end): {token!r}")
+                    if start < 1 or end > 65535:
+                        raise ValueError(f"Ports must be between 1 and 65535: {token!r}")
+                    parsed.update(dict.fromkeys(range(start, end + 1)))
+                return list(parsed)
             
             def main():
-                ports = parse_ports(args.ports)
+                try:
+                    ports = parse_ports(args.ports)
+                except ValueError as e:
+                    print(f"{Fore.RED}{e}{Style.RESET_ALL}")
+                    return
                 scan_subnet(args.cidr_notation, ports, args.threads)
 
             if __name__ == "__main__":
@@ -2266,9 +2324,9 @@ if args.sqli_scan:
                                   'AppleWebKit/537.36 (KHTML, like Gecko) '
                                   'Chrome/58.0.3029.110 Safari/537.3'
                 }
-                start_time = time.time()
+                start_time = time.perf_counter()
                 response = requests.get(time_url, verify=False, headers=headers, timeout=10)
-                end_time = time.time()
+                end_time = time.perf_counter()
                 
                 if end_time - start_time >= 5:
                     vulnerability = {
@@ -2572,7 +2630,8 @@ if args.javascript_endpoints:
         try:
             async with session.get(url, timeout=10) as response:
                 if response.status == 200:
-                    return await response.text()
+                    # Let aiohttp resolve the charset; don't drop pages over a few bad bytes
+                    return await response.text(errors='replace')
                 else:
                     pass
                     return None
@@ -2605,14 +2664,17 @@ if args.javascript_endpoints:
                 js_urls = [line.strip() for line in file if line.strip()]
 
             async with aiohttp.ClientSession() as session:
-                semaphore = asyncio.Semaphore(concurrency)
-                
-                async def bounded_analyze_js_file(js_url):
-                    async with semaphore:
-                        return await analyze_js_file(session, js_url)
-                
-                tasks = [bounded_analyze_js_file(js_url) for js_url in js_urls]
-                results = await asyncio.gather(*tasks)
+                # A fixed pool of workers pulls from one shared iterator instead of
+                # creating a coroutine and a semaphore round-trip per URL
+                results = [None] * len(js_urls)
+                pending = iter(enumerate(js_urls))
+
+                async def worker():
+                    for index, js_url in pending:
+                        results[index] = await analyze_js_file(session, js_url)
+
+                workers = [worker() for _ in range(max(1, min(concurrency, len(js_urls))))]
+                await asyncio.gather(*workers)
 
                 for js_url, endpoints in results:
                     js_files[js_url] = endpoints
@@ -2768,7 +2830,7 @@ if args.custom_headers:
 
     def send_request(url, method='GET', custom_headers=None, data=None, params=None, auth=None, proxies=None, allow_redirects=True, verbose=False):
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             response = requests.request(
                 method=method,
                 url=url,
@@ -2780,7 +2842,7 @@ if args.custom_headers:
                 allow_redirects=allow_redirects,
                 timeout=10
             )
-            end_time = time.time()
+            end_time = time.perf_counter()
 
             print(f"\n{Fore.MAGENTA}Status Code: {response.status_code}{Style.RESET_ALL}")
             print(f"{Fore.MAGENTA}Response Time: {end_time - start_time:.2f} seconds{Style.RESET_ALL}")
@@ -3158,7 +3220,7 @@ if args.autorecon:
             return None
         try:
             async with session.get(url) as response:
-                return await response.text()
+                return await response.text(errors='replace')
         except Exception as e:
             print(f"Error fetching {url}: {e}")
             return None
@@ -3247,10 +3309,12 @@ if args.autorecon:
             if response_text:
                 soup = BeautifulSoup(response_text, 'html.parser')
                 links = set() 
+                # Parse the target once rather than once per relative link
+                target_parsed = urlparse(target)
                 for link in soup.find_all('a', href=True):
                     full_url = link['href']
                     if not full_url.startswith('http'):
-                        full_url = urlparse(target)._replace(path=full_url).geturl()
+                        full_url = target_parsed._replace(path=full_url).geturl()
                     parsed_url = urlparse(full_url)
                     if all([parsed_url.scheme, parsed_url.netloc]):
                         links.add(full_url)
@@ -4024,23 +4088,35 @@ def load_proxies(proxy_file=None, test=True, max_workers=50):
     
     return proxies
 
+# Fallback user agents if fake_useragent fails
+FALLBACK_USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1',
+    'Mozilla/5.0 (iPad; CPU OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/91.0.864.59 Safari/537.36',
+]
+
+# UserAgent() loads its whole browser database, so build it once and reuse it.
+# None means "not tried yet", False means construction failed.
+_user_agent_source = None
+
 def get_random_user_agent():
     """Generate a random user agent"""
-    try:
-        ua = UserAgent()
-        return ua.random
-    except:
-        # Fallback user agents if fake_useragent fails
-        user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
-            'Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1',
-            'Mozilla/5.0 (iPad; CPU OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/91.0.864.59 Safari/537.36',
-        ]
-        return random.choice(user_agents)
+    global _user_agent_source
+    if _user_agent_source is None:
+        try:
+            _user_agent_source = UserAgent()
+        except:
+            _user_agent_source = False
+    if _user_agent_source:
+        try:
+            return _user_agent_source.random
+        except:
+            pass
+    return random.choice(FALLBACK_USER_AGENTS)
 
 def password_wordlist(file: str) -> list:
     with open(file, 'r') as f:
@@ -4995,7 +5071,7 @@ action_taken = any(vars(args).values())
 if not action_taken and not args.update: 
     action_args_present = False
     for arg_name, arg_value in vars(args).items():
-        if arg_value and arg_name not in ['save', 'wordlist', 'threads', 'verbose', 'concurrency', 'shodan_api', 'proxy', 'proxy_file', 'heapdump', 'output_dir', 'token', 'save_ranges', 'forbidden_domains', 'ports', 'depth', 'extensions', 'exclude', 'update', 'shodan_api', 'ftp_scan', 'ftp_userlist', 'ftp_passlist']: # Add other non-action args here
+        if arg_value and arg_name not in ['save', 'wordlist', 'threads', 'verbose', 'concurrency', 'shodan_api', 'proxy', 'proxy_file', 'heapdump', 'output_dir', 'token', 'save_ranges', 'forbidden_domains', 'ports', 'depth', 'extensions', 'exclude', 'update', 'shodan_api', 'ftp_scan', 'ftp_userlist', 'ftp_passlist', 'log_sample_rate']: # Add other non-action args here
             action_taken = True
             break
 
